@@ -64,30 +64,25 @@ def patch_career_stats(career_df: pd.DataFrame, logs: pd.DataFrame) -> pd.DataFr
     true_gp = len(logs)
     if true_gp == 0: return career_df
     
-    # Calculate Fresh Stats
-    updated_row = {
-        "GP": true_gp,
-        "GS": true_gp, 
-        "MIN": logs["MIN"].mean() if "MIN" in logs.columns else 0,
-        "PTS": logs["PTS"].mean(),
-        "REB": logs["REB"].mean(),
-        "AST": logs["AST"].mean(),
-        "STL": logs["STL"].mean() if "STL" in logs.columns else 0,
-        "BLK": logs["BLK"].mean() if "BLK" in logs.columns else 0,
-        "TOV": logs["TOV"].mean() if "TOV" in logs.columns else 0,
-        "FG_PCT": (logs["FGM"].sum() / logs["FGA"].sum()) if logs["FGA"].sum() > 0 else 0,
-        "FG3_PCT": (logs["FG3M"].sum() / logs["FG3A"].sum()) if logs["FG3A"].sum() > 0 else 0,
-        "FT_PCT": (logs["FTM"].sum() / logs["FTA"].sum()) if logs["FTA"].sum() > 0 else 0,
-    }
+    # Calculate Fresh Stats (single aggregation pass; missing columns count as 0)
+    avg_cols = ["MIN", "PTS", "REB", "AST", "STL", "BLK", "TOV"]
+    pct_cols = {"FG_PCT": ("FGM", "FGA"), "FG3_PCT": ("FG3M", "FG3A"), "FT_PCT": ("FTM", "FTA")}
+    shot_cols = [c for pair in pct_cols.values() for c in pair]
+    agg = logs.reindex(columns=avg_cols + shot_cols, fill_value=0).agg(["mean", "sum"])
+    means, sums = agg.loc["mean"], agg.loc["sum"]
+    
+    updated_row = {"GP": true_gp, "GS": true_gp, **means[avg_cols].to_dict()}
+    for pct, (made, att) in pct_cols.items():
+        updated_row[pct] = (sums[made] / sums[att]) if sums[att] > 0 else 0
     
     mask = career_df["SEASON_ID"] == "2025-26"
     if mask.any():
         idx = career_df.index[mask][0]
         current_gp = career_df.at[idx, "GP"]
         if true_gp >= current_gp: 
-             for col, val in updated_row.items():
-                 if col in career_df.columns:
-                     career_df.at[idx, col] = val
+             upd = pd.Series(updated_row, dtype="float64")
+             cols = upd.index.intersection(career_df.columns)
+             career_df.loc[idx, cols] = upd[cols].values
     return career_df
 
 
@@ -1,14 +1,96 @@
 import requests
 import argparse
+import json
+import os
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Function to build the shared session; pooled connections avoid a new TCP+TLS handshake per call
+
+def build_session():
+    session = requests.Session()
+    # Back off and retry transient 429/5xx responses, honouring Retry-After.
+    # Connect/read failures are not retried here; session_get retries those once on a fresh session.
+    retry = Retry(total=5, connect=0, read=0, backoff_factor=1.5, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=frozenset(['GET']), respect_retry_after_header=True, raise_on_status=False)
+    session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=8, pool_maxsize=8))
+    return session
+
+SESSION = build_session()
+
+# Function to drop stale pooled connections and start a fresh session
+
+def clear_session():
+    global SESSION
+    SESSION.close()
+    SESSION = build_session()
+
+# Function to GET through the shared session, rebuilding it once on a dropped or stalled connection
+
+def session_get(url, **kwargs):
+    kwargs.setdefault('timeout', 30)
+    try:
+        return SESSION.get(url, **kwargs)
+    except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout):
+        clear_session()
+        return SESSION.get(url, **kwargs)
+
+# Last schedule response and its validators, used for conditional GETs.
+# Gitignored and local only: a fresh CI checkout starts without it, so only repeat runs on one machine revalidate.
+SCHEDULE_CACHE_FILE = "schedule_cache.json"
+
+# Function to load the cached schedule (empty dict if missing or unreadable)
+
+def load_schedule_cache():
+    if not os.path.exists(SCHEDULE_CACHE_FILE):
+        return {}
+    try:
+        with open(SCHEDULE_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Function to save the schedule together with its ETag/Last-Modified headers (best-effort)
+
+def save_schedule_cache(games, response):
+    cache = {
+        'games': games,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    tmp_file = SCHEDULE_CACHE_FILE + '.tmp'
+    try:
+        # Write to a temp file and swap it in so an interrupted run never leaves a truncated cache
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, SCHEDULE_CACHE_FILE)
+    except OSError:
+        print("Could not write schedule cache")
 
 # Function to fetch the current schedule of the Portland Trail Blazers
 
 def fetch_blazers_schedule():
     url = "https://api.nba.com/schedule"
-    response = requests.get(url)
+    cache = load_schedule_cache()
+    headers = {}
+    if 'games' in cache:
+        # Revalidate instead of re-downloading; an unchanged schedule comes back as a body-less 304
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+    try:
+        response = session_get(url, headers=headers)
+    except requests.exceptions.RequestException:
+        print("Error fetching schedule")
+        return []
+    if response.status_code == 304 and 'games' in cache:
+        return cache['games']
     if response.status_code == 200:
-        return response.json()['games']
+        games = response.json()['games']
+        save_schedule_cache(games, response)
+        return games
     else:
         print("Error fetching schedule")
         return []